@@ -1,124 +1,559 @@
 # AI Universe Explorer - Complete Fixed Version
-from flask import Flask, jsonify, render_template_string
+from flask import Flask, Response, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+import os
 import threading
+import atexit
+import gzip
+import logging
+import logging.handlers
+import queue
 import time
-import json
-import requests
-from datetime import datetime
-from collections import defaultdict, deque
+import asyncio
+import numpy as np
+import orjson
+from concurrent.futures import Future
+from dataclasses import dataclass, field, asdict, fields
+from collections import defaultdict, deque, namedtuple
+from types import MappingProxyType
+from itertools import islice, takewhile
+from bisect import bisect_left
+
+HTTP_HEADERS = {'User-Agent': 'universe-explorer/1.0'}
+COINGECKO_MARKETS_URL = "https://api.coingecko.com/api/v3/coins/markets"
+CRYPTO_PAGES = range(1, 3)  # Top 500 crypto
+CRYPTO_MAX_RETRIES = 3
+CRYPTO_MAX_RETRY_DELAY = 5.0  # Cap on any single Retry-After wait
+CRYPTO_RETRY_BUDGET = 10.0  # Seconds of retry waits per page before it is skipped
+CRYPTO_CONNECTION_LIMIT = 4  # Polite cap on concurrent CoinGecko connections
+RETRY_STATUSES = (429, 502, 503, 504)
+REDIS_SOCKET_PATH = '/tmp/redis.sock'
+UNIVERSE_TTL = 600  # Seconds before a cached domain is rediscovered
+MAX_STORED_INSIGHTS = 20
+MAX_EXPLORATION_HISTORY = 500
+SEARCH_CACHE_TTL = 0.5  # Seconds a finished search is served from memory
+SEARCH_CACHE_SIZE = 256
+STATUS_CACHE_TTL = 10  # Seconds a serialized /status payload is reused
+PATTERN_CAPACITY = 1024  # Initial pattern slots; doubles when full
+NGRAM_SIZE = 3  # Search terms shorter than this fall back to a full scan
+
+def _now_iso():
+    """Local time as an ISO-8601 string to the second, without building a datetime"""
+    return time.strftime('%Y-%m-%dT%H:%M:%S')
+
+# Records are formatted in the calling thread (QueueHandler.prepare), but the
+# stream write moves to a listener thread, so callers never block on stdout
+logger = logging.getLogger('universe')
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(message)s'))
+_queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+_log_listener = None
+
+def _start_log_listener():
+    """(Re)start the log listener; forked workers get a fresh queue and thread"""
+    global _log_listener
+    _queue_handler.queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(_queue_handler.queue, _log_handler)
+    _log_listener.start()
+
+logger.addHandler(_queue_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_start_log_listener()
+os.register_at_fork(after_in_child=_start_log_listener)
+atexit.register(lambda: _log_listener.stop())
+
+# Insight list entry templates (bound str.format, parsed once at import)
+_GAINER_FMT = "{} +{}% (${:.4f})".format
+_LOSER_FMT = "{} {}% (${:.4f})".format
+_GEM_FMT = "{} ${:.4f} (+{}%)".format
+_BLUE_CHIP_FMT = "{} ${:.2f} (${:.1f}B mcap)".format
+_EXPENSIVE_FMT = "{} ${:.0f} ({:+.1f}%)".format
+_VOLATILE_FMT = "{} ±{:.0f}% (${:.4f})".format
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# === SCORING KERNELS ===
+# One bit per coin category in the classify_coins output
+COIN_GAINER = 1 << 0
+COIN_LOSER = 1 << 1
+COIN_VOLATILE = 1 << 2  # Very volatile (>20% either way)
+COIN_BLUE_CHIP = 1 << 3  # >1B mcap
+COIN_GEM = 1 << 4  # Cheap & rising
+COIN_EXPENSIVE = 1 << 5
+
+def _classify_coins_loop(prices, changes, mcaps, out_categories):
+    """One fused pass packing every category into a uint8 bitmask; returns up/down counts"""
+    positive = 0
+    negative = 0
+    
+    for i in range(changes.shape[0]):
+        c = changes[i]
+        p = prices[i]
+        bits = 0
+        if c > 10:
+            bits |= COIN_GAINER
+        if c < -10:
+            bits |= COIN_LOSER
+        if abs(c) > 20:
+            bits |= COIN_VOLATILE
+        if mcaps[i] > 1000000000:
+            bits |= COIN_BLUE_CHIP
+        if p >= 0.01 and p <= 1.0 and c > 5:
+            bits |= COIN_GEM
+        if p > 100:
+            bits |= COIN_EXPENSIVE
+        out_categories[i] = bits
+        positive += c > 0
+        negative += c < 0
+    
+    return positive, negative
+
+def _classify_coins_numpy(prices, changes, mcaps, out_categories):
+    """Vectorized fallback for classify_coins when Numba is unavailable"""
+    out_categories[:] = 0
+    out_categories |= (changes > 10).view(np.uint8) << 0
+    out_categories |= (changes < -10).view(np.uint8) << 1
+    out_categories |= (np.abs(changes) > 20).view(np.uint8) << 2
+    out_categories |= (mcaps > 1000000000).view(np.uint8) << 3
+    out_categories |= ((prices >= 0.01) & (prices <= 1.0) & (changes > 5)).view(np.uint8) << 4
+    out_categories |= (prices > 100).view(np.uint8) << 5
+    return np.count_nonzero(changes > 0), np.count_nonzero(changes < 0)
+
+def _top_indices(mask, key, limit, descending=True):
+    """Indices selected by mask, ordered by key (stable) and cut to limit"""
+    selected = np.flatnonzero(mask)
+    values = -key[selected] if descending else key[selected]
+    
+    if selected.size > limit:
+        # O(n) partition to the k-th value; keep boundary ties so the stable order is unchanged
+        kth = np.partition(values, limit - 1)[limit - 1]
+        keep = values <= kth
+        selected, values = selected[keep], values[keep]
+    
+    order = np.argsort(values, kind='stable')
+    return selected[order[:limit]]
+
+if njit is not None:
+    # Explicit signature compiles (or loads from cache) at import, i.e. once in the
+    # preloaded gunicorn master instead of in every worker's first exploration pass
+    classify_coins = njit('UniTuple(int64, 2)(float64[:], float64[:], float64[:], uint8[:])',
+                          cache=True, fastmath=True)(_classify_coins_loop)
+else:
+    classify_coins = _classify_coins_numpy
+
+# === INSIGHT MODEL ===
+@dataclass(slots=True)
+class Insight:
+    """Autonomous insight; converted to a dict only at the API/storage boundary"""
+    type: str
+    description: str
+    timestamp: str
+    actionable: str = ''
+    data: object = None
+    details: object = None
+    extra: dict = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild an insight from its stored dict form"""
+        known = {f.name for f in fields(cls)}
+        extra = {k: v for k, v in data.items() if k not in known}
+        insight = cls(**{k: v for k, v in data.items() if k in known})
+        insight.extra.update(extra)
+        return insight
+
+# === REDIS STORE ===
+class RedisStore:
+    """Redis-backed universe storage shared across workers and restarts"""
+    
+    def __init__(self, unix_socket_path=REDIS_SOCKET_PATH):
+        self.client = None
+        try:
+            import redis
+            client = redis.Redis(unix_socket_path=unix_socket_path, decode_responses=True)
+            client.ping()
+            self.client = client
+            logger.info("🗄️ Redis store connected")
+        except Exception as e:
+            logger.warning("Redis store unavailable, keeping universe in memory: %s", e)
+    
+    def load_domain(self, domain):
+        """Load a cached domain document, or None if missing/expired"""
+        if self.client is None:
+            return None
+        try:
+            return self.client.json().get(f'universe:{domain}')
+        except Exception as e:
+            logger.error("Redis load error for %s: %s", domain, e)
+            return None
+    
+    def save_domain(self, domain, data, ttl=UNIVERSE_TTL):
+        """Store a domain document that expires after ttl seconds"""
+        if self.client is None:
+            return
+        try:
+            key = f'universe:{domain}'
+            pipe = self.client.pipeline()
+            pipe.json().set(key, '$', data)
+            pipe.expire(key, ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.error("Redis save error for %s: %s", domain, e)
+    
+    def push_insight(self, insight):
+        """Prepend an insight and keep only the most recent ones"""
+        if self.client is None:
+            return
+        try:
+            pipe = self.client.pipeline()
+            pipe.lpush('universe:insights', orjson.dumps(asdict(insight)))
+            pipe.ltrim('universe:insights', 0, MAX_STORED_INSIGHTS - 1)
+            pipe.execute()
+        except Exception as e:
+            logger.error("Redis insight error: %s", e)
+    
+    def load_insights(self):
+        """Load stored insights, oldest first"""
+        if self.client is None:
+            return []
+        try:
+            stored = self.client.lrange('universe:insights', 0, MAX_STORED_INSIGHTS - 1)
+            return [Insight.from_dict(orjson.loads(item)) for item in reversed(stored)]
+        except Exception as e:
+            logger.error("Redis insight load error: %s", e)
+            return []
+
+# Static news sources and research categories; discovered_at is stamped at bootstrap
+_NEWS_FROZEN = MappingProxyType({
+    'TechCrunch': MappingProxyType({
+        'url': 'https://feeds.feedburner.com/TechCrunch',
+        'articles_count': 20,
+        'type': 'news_source'
+    }),
+    'Reuters Business': MappingProxyType({
+        'url': 'https://feeds.reuters.com/reuters/businessNews',
+        'articles_count': 25,
+        'type': 'news_source'
+    })
+})
+_RESEARCH_FROZEN = MappingProxyType({
+    category: MappingProxyType({
+        'recent_papers': 10,
+        'category': category,
+        'type': 'research_category'
+    })
+    for category in ('cs.AI', 'cs.LG', 'cs.CL', 'cs.CV', 'cs.RO')
+})
+
+# === SEARCH COALESCER ===
+class SearchCoalescer:
+    """Single-flight searches: concurrent identical terms share one universe scan"""
+    
+    def __init__(self, search_fn):
+        self.search_fn = search_fn
+        self.waiters = {}  # term -> Future of the scan in flight
+        self.recent = {}  # term -> (expires_at, result) micro-cache for repeated keystrokes
+        self.lock = threading.Lock()
+    
+    def search(self, term):
+        """Return a Future resolved with the term's result, scanning only if none is in flight"""
+        with self.lock:
+            cached = self.recent.get(term)
+            if cached is not None and cached[0] > time.monotonic():
+                future = Future()
+                future.set_result(cached[1])
+                return future
+            
+            future = self.waiters.get(term)
+            if future is not None:
+                return future
+            future = self.waiters[term] = Future()
+        
+        # First caller scans right away in its own thread; later callers wait on its Future
+        try:
+            result = self.search_fn(term)
+        except Exception as e:
+            with self.lock:
+                del self.waiters[term]
+            future.set_exception(e)
+            return future
+        
+        with self.lock:
+            del self.waiters[term]
+            if len(self.recent) >= SEARCH_CACHE_SIZE:
+                self.recent.clear()
+            self.recent[term] = (time.monotonic() + SEARCH_CACHE_TTL, result)
+        
+        future.set_result(result)
+        return future
+
+# === SEARCH INDEX ===
+# One immutable snapshot per domain: the entity dict plus everything _universal_search
+# derives from it, published with a single assignment so readers never mix generations
+DomainIndex = namedtuple('DomainIndex', 'data keys blobs ngram_index prefixes suffixes')
 
 # === UNIVERSE EXPLORER CLASS ===
 class UniverseDataExplorer:
     """Core AI engine for autonomous universe exploration"""
     
     def __init__(self):
-        self.data_universe = defaultdict(dict)
-        self.autonomous_insights = []
-        self.exploration_history = []
-        self.pattern_memory = defaultdict(float)
+        self.data_universe = {}  # Never mutated in place; _set_domain rebinds a new dict
+        self.autonomous_insights = deque(maxlen=MAX_STORED_INSIGHTS)
+        self.exploration_history = deque(maxlen=MAX_EXPLORATION_HISTORY)
+        self._pattern_names = {}
+        self._pattern_values = np.zeros(PATTERN_CAPACITY, dtype=np.float32)
+        self._n_patterns = 0
+        self._search_index = {}  # domain -> DomainIndex; rebound copy-on-write with data_universe
+        self._entity_count = 0
+        self._universe_version = 0  # Bumped whenever a domain or the exploration state changes
+        self._financial_np = self._build_financial_arrays({})
+        self._insights_snapshot = ('W/"0-"', b'[]')
+        self._summary_text = None
+        self._status_cache = None
+        self._universe_lock = threading.Lock()
+        self._insight_lock = threading.Lock()  # Held while an exploration pass runs
         self.exploration_state = {
             'total_discoveries': 0,
             'universe_size': 0,
             'last_update': time.time()
         }
+        self.store = RedisStore()
         
-        print("🌌 Universe Data Explorer initialized")
+        logger.info("🌌 Universe Data Explorer initialized")
         self._bootstrap_universe()
     
     def _bootstrap_universe(self):
         """Bootstrap initial universe discovery"""
-        print("🚀 Bootstrapping universe discovery...")
-        self._discover_crypto_universe()
-        self._discover_news_universe()
-        self._discover_research_universe()
-        print(f"✅ Bootstrap complete: {self.get_total_entities()} entities discovered")
+        logger.info("🚀 Bootstrapping universe discovery...")
+        bootstrap_ts = _now_iso()
+        discoveries = (
+            ('financial', self._discover_crypto_universe),
+            ('news', self._discover_news_universe),
+            ('research', self._discover_research_universe),
+        )
+        
+        for domain, discover in discoveries:
+            cached = self.store.load_domain(domain)
+            if cached:
+                self._set_domain(domain, cached)
+                logger.info("🗄️ Hydrated %d %s entities from Redis", len(cached), domain)
+                continue
+            
+            discover(bootstrap_ts)
+            data = self.data_universe.get(domain)
+            if data:
+                self.store.save_domain(domain, data)
+        
+        self.autonomous_insights.extend(self.store.load_insights())
+        self._refresh_insights_blob()
+        logger.info("✅ Bootstrap complete: %d entities discovered", self.get_total_entities())
+    
+    def _set_domain(self, domain, data):
+        """Replace a domain's entities and refresh its search index"""
+        with self._universe_lock:
+            universe = self.data_universe
+            self._entity_count += len(data) - len(universe.get(domain, {}))
+            index = self._index_domain(data)
+            if domain == 'financial':
+                self._financial_np = self._build_financial_arrays(data)
+            # Copy-on-write: readers holding the old dicts keep a consistent view
+            self.data_universe = {**universe, domain: data}
+            self._search_index = {**self._search_index, domain: index}
+            self._summary_text = None
+            self._universe_version += 1
     
-    def _discover_crypto_universe(self):
+    def _index_domain(self, data):
+        """Build a domain's lowercase UTF-8 text blobs and trigram index for _universal_search"""
+        keys = list(data)
+        blobs = []
+        ngram_index = defaultdict(set)
+        
+        for position, entity in enumerate(keys):
+            texts = [entity.lower()]
+            details = data[entity]
+            if isinstance(details, dict):
+                texts.extend(value.lower() for value in details.values() if isinstance(value, str))
+            # Bytes so the prefilter runs as a memchr/memmem scan; UTF-8 keeps substring matches identical
+            blobs.append('\x1f'.join(texts).encode('utf-8', 'surrogatepass'))
+            
+            for text in texts:
+                if 0 < len(text) < NGRAM_SIZE:
+                    ngram_index[text].add(position)  # Too short for an n-gram, index whole
+                for i in range(len(text) - NGRAM_SIZE + 1):
+                    ngram_index[text[i:i + NGRAM_SIZE]].add(position)
+        
+        return DomainIndex(
+            data=data,
+            keys=keys,
+            blobs=blobs,
+            ngram_index=ngram_index,
+            prefixes=sorted(ngram_index),
+            suffixes=sorted(gram[::-1] for gram in ngram_index)
+        )
+    
+    def _build_financial_arrays(self, data):
+        """Lay out financial fields as contiguous arrays for vectorized scans"""
+        count = len(data)
+        details = list(data.values())
+        return {
+            'symbols': np.array(list(data), dtype=object),
+            'clean_symbols': {symbol: symbol.replace('-USD', '') for symbol in data},
+            'names': np.array([d.get('name', s) for s, d in zip(data, details)], dtype=object),
+            'current_price': np.fromiter((d.get('current_price') or 0 for d in details), dtype=np.float64, count=count),
+            'change24h': np.fromiter((d.get('price_change_24h') or 0 for d in details), dtype=np.float64, count=count),
+            'market_cap': np.fromiter((d.get('market_cap') or 0 for d in details), dtype=np.float64, count=count),
+        }
+    
+    def _search_candidates(self, index, search_lower):
+        """Positions of entities that may contain the term, narrowed via the trigram index"""
+        if len(search_lower) == NGRAM_SIZE - 1:
+            return self._short_term_candidates(index, search_lower)
+        if len(search_lower) < NGRAM_SIZE:
+            return range(len(index.keys))
+        
+        ngram_index = index.ngram_index
+        postings = []
+        for gram in {search_lower[i:i + NGRAM_SIZE] for i in range(len(search_lower) - NGRAM_SIZE + 1)}:
+            posting = ngram_index.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        
+        postings.sort(key=len)
+        return sorted(postings[0].intersection(*postings[1:]))
+    
+    def _short_term_candidates(self, index, search_lower):
+        """Candidates for a term one char shorter than an n-gram.
+        
+        Every occurrence of such a term starts or ends some indexed gram, so
+        bisecting the sorted gram keys (and the reversed keys) finds them all.
+        """
+        ngram_index = index.ngram_index
+        candidates = set()
+        
+        for keys, term, restore in (
+            (index.prefixes, search_lower, lambda key: key),
+            (index.suffixes, search_lower[::-1], lambda key: key[::-1]),
+        ):
+            start = bisect_left(keys, term)
+            following = (keys[i] for i in range(start, len(keys)))
+            for key in takewhile(lambda key: key.startswith(term), following):
+                candidates.update(ngram_index[restore(key)])
+        
+        return sorted(candidates)
+    
+    def _discover_crypto_universe(self, discovered_at=None):
         """Discover cryptocurrency universe"""
         try:
-            print("🪙 Discovering crypto universe...")
-            url = "https://api.coingecko.com/api/v3/coins/markets"
-            crypto_data = {}
-            
-            for page in range(1, 3):  # Top 500 crypto
-                try:
-                    params = {
-                        'vs_currency': 'usd',
-                        'order': 'market_cap_desc',
-                        'per_page': 250,
-                        'page': page
-                    }
-                    
-                    response = requests.get(url, params=params, timeout=10)
-                    if response.status_code == 200:
-                        cryptos = response.json()
-                        for crypto in cryptos:
-                            symbol = crypto['symbol'].upper()
-                            crypto_data[f"{symbol}-USD"] = {
-                                'name': crypto['name'],
-                                'current_price': crypto.get('current_price'),
-                                'market_cap': crypto.get('market_cap'),
-                                'price_change_24h': crypto.get('price_change_percentage_24h', 0),
-                                'discovered_at': datetime.now().isoformat(),
-                                'type': 'cryptocurrency'
-                            }
-                except Exception as e:
-                    print(f"Crypto page {page} error: {e}")
-                    continue
-                
-                time.sleep(1)
+            logger.info("🪙 Discovering crypto universe...")
+            crypto_data = asyncio.run(self._discover_crypto_async(discovered_at))
             
-            self.data_universe['financial'] = crypto_data
-            print(f"🪙 Discovered {len(crypto_data)} cryptocurrencies")
+            self._set_domain('financial', crypto_data)
+            logger.info("🪙 Discovered %d cryptocurrencies", len(crypto_data))
             
         except Exception as e:
-            print(f"Crypto discovery error: {e}")
+            logger.error("Crypto discovery error: %s", e)
+    
+    async def _discover_crypto_async(self, discovered_at=None):
+        """Fetch all CoinGecko market pages concurrently"""
+        import aiohttp  # Deferred: web workers that never discover skip the import
+        
+        crypto_data = {}
+        
+        connector = aiohttp.TCPConnector(limit=CRYPTO_CONNECTION_LIMIT)
+        async with aiohttp.ClientSession(connector=connector, headers=HTTP_HEADERS,
+                                         timeout=aiohttp.ClientTimeout(total=10)) as session:
+            pages = await asyncio.gather(
+                *[self._fetch_crypto_page(session, page) for page in CRYPTO_PAGES],
+                return_exceptions=True
+            )
+        
+        now_iso = discovered_at or _now_iso()
+        for page, cryptos in zip(CRYPTO_PAGES, pages):
+            if isinstance(cryptos, Exception):
+                logger.warning("Crypto page %s error: %s", page, cryptos)
+                continue
+            
+            crypto_data.update({
+                f"{symbol.upper()}-USD": {
+                    'name': name,
+                    'current_price': price,
+                    'market_cap': market_cap,
+                    'price_change_24h': change or 0.0,
+                    'discovered_at': now_iso,
+                    'type': 'cryptocurrency'
+                }
+                for symbol, name, price, market_cap, change in cryptos
+            })
+        
+        return crypto_data
+    
+    async def _fetch_crypto_page(self, session, page):
+        """Fetch a single CoinGecko markets page as (symbol, name, price, market_cap, change) rows"""
+        params = {
+            'vs_currency': 'usd',
+            'order': 'market_cap_desc',
+            'per_page': 250,
+            'page': page
+        }
+        
+        deadline = time.monotonic() + CRYPTO_RETRY_BUDGET
+        for attempt in range(CRYPTO_MAX_RETRIES + 1):
+            async with session.get(COINGECKO_MARKETS_URL, params=params) as response:
+                if response.status == 200:
+                    # Project the ~40 CoinGecko fields down to the five we keep, page by page
+                    return [(crypto['symbol'], crypto['name'], crypto.get('current_price'),
+                             crypto.get('market_cap'), crypto.get('price_change_percentage_24h'))
+                            for crypto in orjson.loads(await response.read())]
+                if response.status not in RETRY_STATUSES or attempt == CRYPTO_MAX_RETRIES:
+                    return []
+                
+                # Back off exponentially, or as long as a 429 asks us to (capped: bootstrap
+                # runs in the gunicorn master, so a long Retry-After would stall startup)
+                retry_after = response.headers.get('Retry-After', '')
+                delay = float(retry_after) if retry_after.isdigit() else 0.3 * 2 ** attempt
+                delay = min(delay, CRYPTO_MAX_RETRY_DELAY)
+                if time.monotonic() + delay > deadline:
+                    return []
+            
+            await asyncio.sleep(delay)
     
-    def _discover_news_universe(self):
+    def _discover_news_universe(self, discovered_at=None):
         """Discover news sources universe"""
         try:
-            print("📰 Discovering news universe...")
-            news_data = {
-                'TechCrunch': {
-                    'url': 'https://feeds.feedburner.com/TechCrunch',
-                    'articles_count': 20,
-                    'type': 'news_source',
-                    'discovered_at': datetime.now().isoformat()
-                },
-                'Reuters Business': {
-                    'url': 'https://feeds.reuters.com/reuters/businessNews',
-                    'articles_count': 25,
-                    'type': 'news_source',
-                    'discovered_at': datetime.now().isoformat()
-                }
-            }
+            logger.info("📰 Discovering news universe...")
+            discovered_at = discovered_at or _now_iso()
+            news_data = {name: dict(source, discovered_at=discovered_at)
+                         for name, source in _NEWS_FROZEN.items()}
             
-            self.data_universe['news'] = news_data
-            print(f"📰 Discovered {len(news_data)} news sources")
+            self._set_domain('news', news_data)
+            logger.info("📰 Discovered %d news sources", len(news_data))
             
         except Exception as e:
-            print(f"News discovery error: {e}")
+            logger.error("News discovery error: %s", e)
     
-    def _discover_research_universe(self):
+    def _discover_research_universe(self, discovered_at=None):
         """Discover research universe"""
         try:
-            print("🧬 Discovering research universe...")
-            research_categories = ['cs.AI', 'cs.LG', 'cs.CL', 'cs.CV', 'cs.RO']
-            research_data = {}
-            
-            for category in research_categories:
-                research_data[category] = {
-                    'recent_papers': 10,
-                    'category': category,
-                    'discovered_at': datetime.now().isoformat(),
-                    'type': 'research_category'
-                }
+            logger.info("🧬 Discovering research universe...")
+            discovered_at = discovered_at or _now_iso()
+            research_data = {category: dict(details, discovered_at=discovered_at)
+                             for category, details in _RESEARCH_FROZEN.items()}
             
-            self.data_universe['research'] = research_data
-            print(f"🧬 Discovered {len(research_data)} research domains")
+            self._set_domain('research', research_data)
+            logger.info("🧬 Discovered %d research domains", len(research_data))
             
         except Exception as e:
-            print(f"Research discovery error: {e}")
+            logger.error("Research discovery error: %s", e)
     
     def autonomous_universe_exploration(self):
         """Perform autonomous exploration"""
@@ -126,164 +561,141 @@ class UniverseDataExplorer:
             'new_discoveries': 0,
             'patterns_found': 0,
             'insights_generated': 0,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
         
-        self._generate_autonomous_insights()
-        self.exploration_state['total_discoveries'] = self.get_total_entities()
-        self.exploration_state['last_update'] = time.time()
-        exploration_results['insights_generated'] = len(self.autonomous_insights)
+        # A pass already in flight will publish fresh insights; don't duplicate it
+        if not self._insight_lock.acquire(blocking=False):
+            exploration_results['skipped'] = True
+            return exploration_results
+        
+        try:
+            self._generate_autonomous_insights()
+            self.exploration_state['total_discoveries'] = self.get_total_entities()
+            self.exploration_state['last_update'] = time.time()
+            self._universe_version += 1
+            self._refresh_insights_blob()
+            exploration_results['insights_generated'] = len(self.autonomous_insights)
+        finally:
+            self._insight_lock.release()
         
         return exploration_results
     
+    def is_exploring(self):
+        """Whether an exploration pass is running right now"""
+        return self._insight_lock.locked()
+    
+    async def autonomous_universe_exploration_async(self):
+        """Perform autonomous exploration on the background event loop"""
+        return self.autonomous_universe_exploration()
+    
     def _generate_autonomous_insights(self):
         """Generate ACTIONABLE insights with concrete data"""
+        ts = _now_iso()
         try:
-            # Clear old insights if too many
-            if len(self.autonomous_insights) > 15:
-                self.autonomous_insights = self.autonomous_insights[-8:]
-            
-            # Get current data
-            financial_data = self.data_universe.get('financial', {})
-            domains = list(self.data_universe.keys())
-            total_entities = self.get_total_entities()
+            # Get current data (one consistent snapshot of the financial columns)
+            financial_np = self._financial_np
+            coin_count = len(financial_np['symbols'])
             
-            if financial_data:
-                # CONCRETE PRICE ANALYSIS
-                gainers = []
-                losers = []
-                high_volume = []
-                cheap_gems = []
-                expensive_coins = []
+            if coin_count:
+                # CONCRETE PRICE ANALYSIS (vectorized over the financial arrays)
+                symbols = financial_np['symbols']
+                names = financial_np['names']
+                prices = financial_np['current_price']
+                changes = financial_np['change24h']
+                mcaps = financial_np['market_cap']
+                clean_symbols = financial_np['clean_symbols']
+                rounded_changes = np.round(changes, 1)
                 
-                for symbol, data in financial_data.items():
-                    if isinstance(data, dict):
-                        price = data.get('current_price', 0)
-                        change = data.get('price_change_24h', 0)
-                        market_cap = data.get('market_cap', 0)
-                        name = data.get('name', symbol)
-                        
-                        # Top gainers
-                        if change > 10:
-                            gainers.append((name, symbol, round(change, 1), price))
-                        
-                        # Top losers
-                        if change < -10:
-                            losers.append((name, symbol, round(change, 1), price))
-                        
-                        # High market cap (valuable)
-                        if market_cap and market_cap > 1000000000:  # >1B
-                            high_volume.append((name, symbol, price, market_cap))
-                        
-                        # Cheap potential gems
-                        if price and 0.01 <= price <= 1.0 and change > 5:
-                            cheap_gems.append((name, symbol, price, round(change, 1)))
-                        
-                        # Expensive coins
-                        if price and price > 100:
-                            expensive_coins.append((name, symbol, price, round(change, 1)))
+                categories = np.empty(coin_count, dtype=np.uint8)
+                total_positive, total_negative = classify_coins(prices, changes, mcaps, categories)
+                total_positive = int(total_positive)
+                total_negative = int(total_negative)
                 
-                # Sort lists
-                gainers.sort(key=lambda x: x[2], reverse=True)  # By % change
-                losers.sort(key=lambda x: x[2])  # By % change (most negative first)
-                high_volume.sort(key=lambda x: x[3], reverse=True)  # By market cap
-                cheap_gems.sort(key=lambda x: x[3], reverse=True)  # By % change
-                expensive_coins.sort(key=lambda x: x[2], reverse=True)  # By price
+                top_gainers = [(names[i], symbols[i], round(float(changes[i]), 1), float(prices[i]))
+                               for i in _top_indices(categories & COIN_GAINER, rounded_changes, 5)]
+                top_losers = [(names[i], symbols[i], round(float(changes[i]), 1), float(prices[i]))
+                              for i in _top_indices(categories & COIN_LOSER, rounded_changes, 3, descending=False)]
+                gems = [(names[i], symbols[i], float(prices[i]), round(float(changes[i]), 1))
+                        for i in _top_indices(categories & COIN_GEM, rounded_changes, 3)]
+                blue_chips = [(names[i], symbols[i], float(prices[i]), float(mcaps[i]))
+                              for i in _top_indices(categories & COIN_BLUE_CHIP, mcaps, 5)]
+                expensive = [(names[i], symbols[i], float(prices[i]), round(float(changes[i]), 1))
+                             for i in _top_indices(categories & COIN_EXPENSIVE, prices, 3)]
                 
                 # ACTIONABLE INSIGHTS
                 
                 # 1. TOP GAINERS
-                if gainers:
-                    top_gainers = gainers[:5]
-                    insight_text = f"🚀 TOP GAINERS: "
-                    for name, symbol, change, price in top_gainers:
-                        clean_symbol = symbol.replace('-USD', '')
-                        insight_text += f"{clean_symbol} +{change}% (${price:.4f}), "
-                    insight_text = insight_text.rstrip(', ')
+                if top_gainers:
+                    parts = [_GAINER_FMT(clean_symbols[symbol], change, price)
+                             for name, symbol, change, price in top_gainers]
+                    insight_text = "🚀 TOP GAINERS: " + ", ".join(parts)
                     
-                    self.autonomous_insights.append({
-                        'type': 'top_gainers',
-                        'description': insight_text,
-                        'actionable': f"Consider research on {len(top_gainers)} high-momentum coins",
-                        'data': top_gainers,
-                        'timestamp': datetime.now().isoformat()
-                    })
+                    self._record_insight(Insight(
+                        type='top_gainers',
+                        description=insight_text,
+                        actionable=f"Consider research on {len(top_gainers)} high-momentum coins",
+                        data=top_gainers,
+                        timestamp=ts
+                    ))
                 
                 # 2. TOP LOSERS (POTENTIAL OPPORTUNITIES)
-                if losers:
-                    top_losers = losers[:3]
-                    insight_text = f"📉 POTENTIAL OPPORTUNITIES (Big Drops): "
-                    for name, symbol, change, price in top_losers:
-                        clean_symbol = symbol.replace('-USD', '')
-                        insight_text += f"{clean_symbol} {change}% (${price:.4f}), "
-                    insight_text = insight_text.rstrip(', ')
+                if top_losers:
+                    parts = [_LOSER_FMT(clean_symbols[symbol], change, price)
+                             for name, symbol, change, price in top_losers]
+                    insight_text = "📉 POTENTIAL OPPORTUNITIES (Big Drops): " + ", ".join(parts)
                     
-                    self.autonomous_insights.append({
-                        'type': 'potential_opportunities',
-                        'description': insight_text,
-                        'actionable': "Research if drops are temporary or fundamental issues",
-                        'data': top_losers,
-                        'timestamp': datetime.now().isoformat()
-                    })
+                    self._record_insight(Insight(
+                        type='potential_opportunities',
+                        description=insight_text,
+                        actionable="Research if drops are temporary or fundamental issues",
+                        data=top_losers,
+                        timestamp=ts
+                    ))
                 
                 # 3. CHEAP GEMS ANALYSIS
-                if cheap_gems:
-                    gems = cheap_gems[:3]
-                    insight_text = f"💎 CHEAP GEMS (Rising & Under $1): "
-                    for name, symbol, price, change in gems:
-                        clean_symbol = symbol.replace('-USD', '')
-                        insight_text += f"{clean_symbol} ${price:.4f} (+{change}%), "
-                    insight_text = insight_text.rstrip(', ')
+                if gems:
+                    parts = [_GEM_FMT(clean_symbols[symbol], price, change)
+                             for name, symbol, price, change in gems]
+                    insight_text = "💎 CHEAP GEMS (Rising & Under $1): " + ", ".join(parts)
                     
-                    self.autonomous_insights.append({
-                        'type': 'cheap_gems',
-                        'description': insight_text,
-                        'actionable': f"Low-price coins with upward momentum - research fundamentals",
-                        'data': gems,
-                        'timestamp': datetime.now().isoformat()
-                    })
+                    self._record_insight(Insight(
+                        type='cheap_gems',
+                        description=insight_text,
+                        actionable=f"Low-price coins with upward momentum - research fundamentals",
+                        data=gems,
+                        timestamp=ts
+                    ))
                 
                 # 4. BLUE CHIP ANALYSIS
-                if high_volume:
-                    blue_chips = high_volume[:5]
-                    insight_text = f"🏦 BLUE CHIP STATUS: "
-                    for name, symbol, price, mcap in blue_chips:
-                        clean_symbol = symbol.replace('-USD', '')
-                        mcap_b = mcap / 1000000000  # Convert to billions
-                        insight_text += f"{clean_symbol} ${price:.2f} (${mcap_b:.1f}B mcap), "
-                    insight_text = insight_text.rstrip(', ')
+                if blue_chips:
+                    parts = [_BLUE_CHIP_FMT(clean_symbols[symbol], price, mcap / 1000000000)
+                             for name, symbol, price, mcap in blue_chips]
+                    insight_text = "🏦 BLUE CHIP STATUS: " + ", ".join(parts)
                     
-                    self.autonomous_insights.append({
-                        'type': 'blue_chip_analysis',
-                        'description': insight_text,
-                        'actionable': "Stable large-cap coins for conservative portfolio allocation",
-                        'data': blue_chips,
-                        'timestamp': datetime.now().isoformat()
-                    })
+                    self._record_insight(Insight(
+                        type='blue_chip_analysis',
+                        description=insight_text,
+                        actionable="Stable large-cap coins for conservative portfolio allocation",
+                        data=blue_chips,
+                        timestamp=ts
+                    ))
                 
                 # 5. EXPENSIVE COINS WATCH
-                if expensive_coins:
-                    expensive = expensive_coins[:3]
-                    insight_text = f"💰 HIGH-VALUE COINS: "
-                    for name, symbol, price, change in expensive:
-                        clean_symbol = symbol.replace('-USD', '')
-                        insight_text += f"{clean_symbol} ${price:.0f} ({change:+.1f}%), "
-                    insight_text = insight_text.rstrip(', ')
+                if expensive:
+                    parts = [_EXPENSIVE_FMT(clean_symbols[symbol], price, change)
+                             for name, symbol, price, change in expensive]
+                    insight_text = "💰 HIGH-VALUE COINS: " + ", ".join(parts)
                     
-                    self.autonomous_insights.append({
-                        'type': 'high_value_watch',
-                        'description': insight_text,
-                        'actionable': "Premium coins - track for institutional adoption signals",
-                        'data': expensive,
-                        'timestamp': datetime.now().isoformat()
-                    })
+                    self._record_insight(Insight(
+                        type='high_value_watch',
+                        description=insight_text,
+                        actionable="Premium coins - track for institutional adoption signals",
+                        data=expensive,
+                        timestamp=ts
+                    ))
                 
                 # 6. MARKET TEMPERATURE
-                total_positive = len([x for x in financial_data.values() 
-                                    if isinstance(x, dict) and x.get('price_change_24h', 0) > 0])
-                total_negative = len([x for x in financial_data.values() 
-                                    if isinstance(x, dict) and x.get('price_change_24h', 0) < 0])
-                
                 if total_positive > total_negative:
                     market_sentiment = "BULLISH"
                     emoji = "🟢"
@@ -291,61 +703,100 @@ class UniverseDataExplorer:
                     market_sentiment = "BEARISH" 
                     emoji = "🔴"
                 
-                percentage_up = (total_positive / len(financial_data)) * 100
+                percentage_up = (total_positive / coin_count) * 100
                 
-                self.autonomous_insights.append({
-                    'type': 'market_sentiment',
-                    'description': f"{emoji} MARKET SENTIMENT: {market_sentiment} - {percentage_up:.0f}% of coins are green ({total_positive} up, {total_negative} down)",
-                    'actionable': f"Market is {market_sentiment.lower()} - adjust strategy accordingly",
-                    'sentiment': market_sentiment,
-                    'timestamp': datetime.now().isoformat()
-                })
+                self._record_insight(Insight(
+                    type='market_sentiment',
+                    description=f"{emoji} MARKET SENTIMENT: {market_sentiment} - {percentage_up:.0f}% of coins are green ({total_positive} up, {total_negative} down)",
+                    actionable=f"Market is {market_sentiment.lower()} - adjust strategy accordingly",
+                    extra={'sentiment': market_sentiment},
+                    timestamp=ts
+                ))
                 
                 # 7. VOLATILITY ALERT
-                high_volatility = []
-                for symbol, data in financial_data.items():
-                    if isinstance(data, dict):
-                        change = abs(data.get('price_change_24h', 0))
-                        if change > 20:  # Very volatile
-                            name = data.get('name', symbol)
-                            price = data.get('current_price', 0)
-                            high_volatility.append((name, symbol, change, price))
-                
-                if high_volatility:
-                    vol_coins = sorted(high_volatility, key=lambda x: x[2], reverse=True)[:3]
-                    insight_text = f"⚡ HIGH VOLATILITY ALERT: "
-                    for name, symbol, change, price in vol_coins:
-                        clean_symbol = symbol.replace('-USD', '')
-                        insight_text += f"{clean_symbol} ±{change:.0f}% (${price:.4f}), "
-                    insight_text = insight_text.rstrip(', ')
+                if (categories & COIN_VOLATILE).any():  # Very volatile (>20% either way)
+                    abs_change = np.abs(changes)
+                    vol_coins = [(names[i], symbols[i], float(abs_change[i]), float(prices[i]))
+                                 for i in _top_indices(categories & COIN_VOLATILE, abs_change, 3)]
+                    parts = [_VOLATILE_FMT(clean_symbols[symbol], change, price)
+                             for name, symbol, change, price in vol_coins]
+                    insight_text = "⚡ HIGH VOLATILITY ALERT: " + ", ".join(parts)
                     
-                    self.autonomous_insights.append({
-                        'type': 'volatility_alert',
-                        'description': insight_text,
-                        'actionable': "Extreme volatility detected - high risk/reward potential",
-                        'data': vol_coins,
-                        'timestamp': datetime.now().isoformat()
-                    })
+                    self._record_insight(Insight(
+                        type='volatility_alert',
+                        description=insight_text,
+                        actionable="Extreme volatility detected - high risk/reward potential",
+                        data=vol_coins,
+                        timestamp=ts
+                    ))
             
             # 8. SYSTEM STATUS WITH CONCRETE DATA
-            self.autonomous_insights.append({
-                'type': 'discovery_summary',
-                'description': f"📊 ACTIVE MONITORING: {len(financial_data)} cryptocurrencies, {len(self.data_universe.get('news', {}))} news sources, {len(self.data_universe.get('research', {}))} research domains",
-                'actionable': f"Real-time data on {len(financial_data)} digital assets available for analysis",
-                'timestamp': datetime.now().isoformat()
-            })
+            description, actionable = self._discovery_summary_text()
+            self._record_insight(Insight(
+                type='discovery_summary',
+                description=description,
+                actionable=actionable,
+                timestamp=ts
+            ))
             
-            print(f"💡 Generated {len(self.autonomous_insights)} actionable insights")
+            logger.info("💡 Generated %d actionable insights", len(self.autonomous_insights))
             
         except Exception as e:
-            print(f"Insight generation error: {e}")
+            logger.error("Insight generation error: %s", e)
             # Fallback insight
-            self.autonomous_insights.append({
-                'type': 'system_status',
-                'description': f"🔍 AI actively exploring universe - {self.get_total_entities()} entities tracked",
-                'actionable': "Data collection in progress - check back for detailed analysis",
-                'timestamp': datetime.now().isoformat()
-            })
+            self._record_insight(Insight(
+                type='system_status',
+                description=f"🔍 AI actively exploring universe - {self.get_total_entities()} entities tracked",
+                actionable="Data collection in progress - check back for detailed analysis",
+                timestamp=ts
+            ))
+    
+    def _discovery_summary_text(self):
+        """Summary insight text, rebuilt only after a domain changes"""
+        if self._summary_text is None:
+            universe = self.data_universe
+            crypto_count = len(universe.get('financial', {}))
+            self._summary_text = (
+                f"📊 ACTIVE MONITORING: {crypto_count} cryptocurrencies, {len(universe.get('news', {}))} news sources, {len(universe.get('research', {}))} research domains",
+                f"Real-time data on {crypto_count} digital assets available for analysis"
+            )
+        return self._summary_text
+    
+    def bump_pattern(self, name, value=1.0):
+        """Add value to a named pattern's score"""
+        index = self._pattern_names.get(name)
+        if index is None:
+            index = self._n_patterns
+            self._pattern_names[name] = index
+            self._n_patterns += 1
+            if index >= len(self._pattern_values):
+                self._pattern_values = np.resize(self._pattern_values, len(self._pattern_values) * 2)
+                self._pattern_values[index:] = 0
+        self._pattern_values[index] += value
+    
+    def top_patterns(self, limit=10):
+        """Get the highest scoring patterns as (name, score) pairs"""
+        values = self._pattern_values[:self._n_patterns]
+        if limit < len(values):
+            top = np.argpartition(-values, limit)[:limit]
+        else:
+            top = np.arange(len(values))
+        top = top[np.argsort(-values[top], kind='stable')]
+        names = list(self._pattern_names)
+        return [(names[i], float(values[i])) for i in top]
+    
+    def sync_insights_from_store(self):
+        """Replace local insights with those persisted by the exploring worker"""
+        stored = self.store.load_insights()
+        if stored:
+            self.autonomous_insights.clear()
+            self.autonomous_insights.extend(stored)
+            self._refresh_insights_blob()
+    
+    def _record_insight(self, insight):
+        """Keep an insight in memory and persist it to the store"""
+        self.autonomous_insights.append(insight)
+        self.store.push_insight(insight)
     
     def _universal_search(self, search_term):
         """Search across entire universe"""
@@ -353,30 +804,40 @@ class UniverseDataExplorer:
             'search_term': search_term,
             'results_by_domain': {},
             'total_matches': 0,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
         
         search_lower = search_term.lower()
+        search_bytes = search_lower.encode('utf-8', 'surrogatepass')
         
-        for domain, data in self.data_universe.items():
+        for domain, index in self._search_index.items():  # Snapshot; domain indexes are swapped, never mutated
+            data, keys, blobs = index.data, index.keys, index.blobs
             domain_matches = []
             
-            for entity, details in data.items():
+            for position in self._search_candidates(index, search_lower):
+                # One substring check over all lowercased text before inspecting fields
+                if search_bytes not in blobs[position]:
+                    continue
+                
+                entity = keys[position]
+                details = data[entity]
                 if search_lower in entity.lower():
                     domain_matches.append({
                         'entity': entity,
                         'match_type': 'name',
                         'details': details
                     })
-                elif isinstance(details, dict):
-                    for key, value in details.items():
-                        if isinstance(value, str) and search_lower in value.lower():
-                            domain_matches.append({
-                                'entity': entity,
-                                'match_type': key,
-                                'match_value': value
-                            })
-                            break
+                    continue
+                
+                if isinstance(details, dict):
+                    hit = next(((key, value) for key, value in details.items()
+                                if isinstance(value, str) and search_lower in value.lower()), None)
+                    if hit:
+                        domain_matches.append({
+                            'entity': entity,
+                            'match_type': hit[0],
+                            'match_value': hit[1]
+                        })
             
             if domain_matches:
                 search_results['results_by_domain'][domain] = domain_matches
@@ -399,231 +860,238 @@ class UniverseDataExplorer:
             'total_discoveries': self.get_total_entities(),
             'autonomous_insights': len(self.autonomous_insights),
             'exploration_state': self.exploration_state,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
     
+    def get_universe_status_etag(self):
+        """Weak ETag for /status; changes with the universe version or insight count"""
+        return f'W/"{self._universe_version}-{len(self.autonomous_insights)}"'
+    
+    def get_universe_status_json(self):
+        """Serialized universe status, reused until the next exploration or TTL bucket"""
+        key = (self._universe_version, len(self.autonomous_insights), int(time.time() // STATUS_CACHE_TTL))
+        cached = self._status_cache
+        if cached is None or cached[0] != key:
+            cached = self._status_cache = (key, orjson.dumps(self.get_universe_status(), option=orjson.OPT_NON_STR_KEYS))
+        return cached[1]
+    
     def get_recent_insights(self, limit=10):
         """Get recent insights"""
         recent_insights = []
         
-        for insight in self.autonomous_insights[-limit:]:
+        start = max(0, len(self.autonomous_insights) - limit)
+        for insight in islice(self.autonomous_insights, start, None):
             recent_insights.append({
-                'category': insight.get('type', 'general'),
-                'description': insight.get('description', ''),
-                'timestamp': insight.get('timestamp', ''),
-                'details': insight.get('details', {})
+                'category': insight.type or 'general',
+                'description': insight.description,
+                'timestamp': insight.timestamp,
+                'details': insight.details if insight.details is not None else {}
             })
         
         return recent_insights
     
+    def get_recent_insights_snapshot(self):
+        """Get (etag, JSON bytes) of recent insights from the last insight cycle"""
+        return self._insights_snapshot
+    
+    def _refresh_insights_blob(self):
+        """Re-serialize recent insights once per insight-generation cycle"""
+        recent = self.get_recent_insights()
+        last_timestamp = recent[-1]['timestamp'] if recent else ''
+        # Timestamps are second-resolution; the version separates passes within one second
+        etag = f'W/"{len(self.autonomous_insights)}-{last_timestamp}-{self._universe_version}"'
+        self._insights_snapshot = (etag, orjson.dumps(recent, option=orjson.OPT_NON_STR_KEYS))
+    
     def get_total_entities(self):
         """Get total entities discovered"""
-        return sum(len(domain_data) for domain_data in self.data_universe.values())
+        return self._entity_count
 
 # === FLASK APP ===
+class OrjsonProvider(DefaultJSONProvider):
+    """Route Flask's own JSON handling (jsonify, request.get_json) through orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+if Compress is not None:
+    # API JSON only; the dashboard page ships its own precompressed copy
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)
 
 # Initialize AI Universe Explorer
 explorer = UniverseDataExplorer()
+search_coalescer = SearchCoalescer(explorer._universal_search)
 exploration_active = True
 
-# Background exploration thread
-def continuous_exploration():
-    global exploration_active
+def _json(obj):
+    """Serialize a payload with orjson into a JSON response"""
+    if not isinstance(obj, bytes):
+        obj = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return Response(obj, mimetype='application/json')
+
+def _conditional_json(etag, build_payload):
+    """JSON response that short-circuits to 304 when the client's ETag matches"""
+    client_etag = request.headers.get('If-None-Match', '')
+    # Flask-Compress hands out W/"<tag>:br" style tags for compressed bodies
+    if client_etag == etag or (client_etag.startswith(etag[:-1] + ':') and client_etag.endswith('"')):
+        return Response(status=304, headers={'ETag': etag})
+    
+    response = _json(build_payload())
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'max-age=5, must-revalidate'
+    return response
+
+# Background exploration loop (started per process, see start_background_exploration)
+exploration_loop = None
+exploration_wake = None  # Set to run the periodic exploration immediately
+pending_exploration = None  # Future of an /explore pass queued on a non-periodic loop
+pending_exploration_lock = threading.Lock()
+
+async def wait_for_wake(timeout):
+    try:
+        await asyncio.wait_for(exploration_wake.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    exploration_wake.clear()
+
+async def continuous_exploration():
+    while exploration_active:
+        try:
+            result = await explorer.autonomous_universe_exploration_async()
+            logger.info("🔍 Auto-discovery: %s", result)
+            await wait_for_wake(300)  # Every 5 minutes, or when triggered
+        except Exception as e:
+            logger.error("Exploration error: %s", e)
+            await wait_for_wake(600)
+
+async def continuous_store_sync():
     while exploration_active:
         try:
-            result = explorer.autonomous_universe_exploration()
-            print(f"🔍 Auto-discovery: {result}")
-            time.sleep(300)  # Every 5 minutes
+            explorer.sync_insights_from_store()
         except Exception as e:
-            print(f"Exploration error: {e}")
-            time.sleep(600)
+            logger.error("Store sync error: %s", e)
+        await asyncio.sleep(30)
+
+def run_exploration_loop(loop, periodic):
+    asyncio.set_event_loop(loop)
+    loop.create_task(continuous_exploration() if periodic else continuous_store_sync())
+    try:
+        loop.run_forever()
+    finally:
+        # Let cancelled tasks unwind before the loop closes
+        tasks = asyncio.all_tasks(loop)
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.close()
+
+def start_background_exploration(leader=True):
+    """Start this process's exploration loop.
+    
+    Only the leader runs the periodic exploration; other gunicorn workers
+    pick up its insights from the Redis store (or explore themselves when
+    no store is available).
+    """
+    global exploration_loop, exploration_wake
+    periodic = leader or explorer.store.client is None
+    exploration_loop = asyncio.new_event_loop()
+    exploration_wake = asyncio.Event() if periodic else None
+    exploration_thread = threading.Thread(target=run_exploration_loop, args=(exploration_loop, periodic))
+    exploration_thread.daemon = True
+    exploration_thread.start()
+    atexit.register(stop_background_exploration, exploration_loop, exploration_thread)
+    return exploration_thread
 
-# Start background exploration
-exploration_thread = threading.Thread(target=continuous_exploration)
-exploration_thread.daemon = True
-exploration_thread.start()
+def stop_background_exploration(loop, thread, timeout=5):
+    """Stop an exploration loop between passes and wait for its thread to finish"""
+    if loop.is_closed():
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+
+# Dashboard page ships as static/dashboard.html; gzip-capable clients get a compressed
+# copy that is rebuilt whenever the file on disk changes
+DASHBOARD_FILE = 'dashboard.html'
+_dashboard_gz = None  # (mtime_ns, gzip bytes)
+
+def _dashboard_gzip():
+    """Current gzipped dashboard and the file's mtime in nanoseconds"""
+    global _dashboard_gz
+    path = os.path.join(app.static_folder, DASHBOARD_FILE)
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _dashboard_gz
+    if cached is None or cached[0] != mtime_ns:
+        with open(path, 'rb') as dashboard_file:
+            cached = _dashboard_gz = (mtime_ns, gzip.compress(dashboard_file.read(), mtime=0))
+    return cached
 
 @app.route('/')
 def dashboard():
     """Main dashboard"""
-    html_template = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>🌌 AI Universe Explorer</title>
-        <meta name="viewport" content="width=device-width, initial-scale=1">
-        <style>
-            body { font-family: Arial, sans-serif; margin: 20px; background: #0a0a0a; color: #fff; }
-            .container { max-width: 800px; margin: 0 auto; }
-            .card { background: #1a1a1a; padding: 20px; margin: 10px 0; border-radius: 10px; border-left: 4px solid #00ff88; }
-            .status { display: flex; justify-content: space-between; flex-wrap: wrap; }
-            .metric { text-align: center; margin: 10px; }
-            .metric h3 { margin: 0; color: #00ff88; font-size: 2em; }
-            .metric p { margin: 5px 0; color: #888; }
-            button { background: #00ff88; color: black; border: none; padding: 10px 20px; border-radius: 5px; cursor: pointer; margin: 5px; }
-            button:hover { background: #00cc70; }
-            .insights { max-height: 300px; overflow-y: auto; }
-            .insight-item { border-bottom: 1px solid #333; padding: 10px 0; }
-            .insight-category { color: #00ff88; font-weight: bold; }
-            .insight-description { margin: 5px 0; }
-            .insight-timestamp { color: #888; font-size: 0.8em; }
-            @media (max-width: 600px) { .status { flex-direction: column; } }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>🌌 AI Universe Explorer</h1>
-            <p>Autonomous AI exploring the entire data universe 24/7</p>
-            
-            <div class="card">
-                <h2>📊 Universe Status</h2>
-                <div class="status" id="status">
-                    <div class="metric">
-                        <h3 id="entities">Loading...</h3>
-                        <p>Total Entities</p>
-                    </div>
-                    <div class="metric">
-                        <h3 id="insights">Loading...</h3>
-                        <p>AI Insights</p>
-                    </div>
-                    <div class="metric">
-                        <h3 id="domains">Loading...</h3>
-                        <p>Data Domains</p>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="card">
-                <h2>🔍 Search Universe</h2>
-                <input type="text" id="searchInput" placeholder="Search anything in the universe..." style="width: 70%; padding: 10px; margin-right: 10px; background: #333; color: #fff; border: 1px solid #555;">
-                <button onclick="searchUniverse()">Search</button>
-                <div id="searchResults"></div>
-            </div>
-            
-            <div class="card">
-                <h2>💡 Latest AI Insights</h2>
-                <div id="insights-list" class="insights">Loading insights...</div>
-                <button onclick="refreshInsights()">Refresh Insights</button>
-            </div>
-            
-            <div class="card">
-                <h2>🌍 Quick Actions</h2>
-                <button onclick="window.location.href='/status'">Full Status JSON</button>
-                <button onclick="window.location.href='/insights'">All Insights JSON</button>
-                <button onclick="exploreMore()">Trigger New Exploration</button>
-            </div>
-        </div>
-        
-        <script>
-            setInterval(updateDashboard, 30000);
-            updateDashboard();
-            loadInsights();
-            
-            async function updateDashboard() {
-                try {
-                    const response = await fetch('/status');
-                    const data = await response.json();
-                    
-                    document.getElementById('entities').textContent = data.total_discoveries || '0';
-                    document.getElementById('insights').textContent = data.autonomous_insights || '0';
-                    document.getElementById('domains').textContent = Object.keys(data.universe_statistics || {}).length;
-                } catch (e) {
-                    console.error('Error updating dashboard:', e);
-                }
-            }
-            
-            async function loadInsights() {
-                try {
-                    const response = await fetch('/insights');
-                    const insights = await response.json();
-                    
-                    const container = document.getElementById('insights-list');
-                    if (insights.length > 0) {
-                        container.innerHTML = insights.slice(0, 8).map(insight => 
-                            `<div class="insight-item">
-                                <div class="insight-category">${insight.category}</div>
-                                <div class="insight-description">${insight.description}</div>
-                                <div class="insight-timestamp">${insight.timestamp}</div>
-                            </div>`
-                        ).join('');
-                    } else {
-                        container.innerHTML = '<p>🤖 AI is exploring... insights coming soon!</p>';
-                    }
-                } catch (e) {
-                    console.error('Error loading insights:', e);
-                }
-            }
-            
-            async function searchUniverse() {
-                const query = document.getElementById('searchInput').value;
-                if (!query) return;
-                
-                const resultsDiv = document.getElementById('searchResults');
-                resultsDiv.innerHTML = '<p>🔍 Searching universe...</p>';
-                
-                try {
-                    const response = await fetch(`/search/${encodeURIComponent(query)}`);
-                    const results = await response.json();
-                    
-                    if (results.total_matches > 0) {
-                        resultsDiv.innerHTML = `
-                            <h4>Found ${results.total_matches} matches:</h4>
-                            ${Object.entries(results.results_by_domain).map(([domain, matches]) => 
-                                `<p><strong>${domain}:</strong> ${matches.length} matches</p>`
-                            ).join('')}
-                        `;
-                    } else {
-                        resultsDiv.innerHTML = '<p>❌ No matches found in current universe</p>';
-                    }
-                } catch (e) {
-                    resultsDiv.innerHTML = '<p>⚠️ Search error occurred</p>';
-                }
-            }
-            
-            function refreshInsights() {
-                loadInsights();
-                updateDashboard();
-            }
-            
-            async function exploreMore() {
-                try {
-                    const response = await fetch('/explore');
-                    const result = await response.json();
-                    alert('🚀 New exploration triggered! ' + result.result.insights_generated + ' insights generated');
-                    setTimeout(() => {
-                        updateDashboard();
-                        loadInsights();
-                    }, 2000);
-                } catch (e) {
-                    alert('⚠️ Exploration trigger failed');
-                }
-            }
-        </script>
-    </body>
-    </html>
-    """
-    return render_template_string(html_template)
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        mtime_ns, body = _dashboard_gzip()
+        response = Response(body, mimetype='text/html',
+                            headers={'Content-Encoding': 'gzip', 'Cache-Control': 'public, max-age=60'})
+        response.set_etag(f'dashboard-{mtime_ns:x}-gzip')
+        response.last_modified = mtime_ns / 1e9
+        response.make_conditional(request)
+    else:
+        # Streamed from disk (sendfile where available) with Last-Modified/ETag revalidation
+        response = send_from_directory(app.static_folder, DASHBOARD_FILE, max_age=60)
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
 
 @app.route('/status')
 def status():
-    return jsonify(explorer.get_universe_status())
+    etag = explorer.get_universe_status_etag()
+    return _conditional_json(etag, explorer.get_universe_status_json)
 
 @app.route('/insights')
 def insights():
-    return jsonify(explorer.get_recent_insights())
+    etag, blob = explorer.get_recent_insights_snapshot()
+    return _conditional_json(etag, lambda: blob)
 
 @app.route('/search/<term>')
 def search(term):
-    return jsonify(explorer._universal_search(term))
+    return _json(search_coalescer.search(term).result())
+
+def _exploration_busy():
+    """429 answer for /explore while a pass is running or already queued"""
+    return _json({"success": False, "error": "Exploration already running"}), 429
 
 @app.route('/explore')
 def trigger_exploration():
+    global pending_exploration
+    if explorer.is_exploring():
+        return _exploration_busy()
+    
+    if exploration_loop is None:
+        # Started by gunicorn_conf.post_fork or __main__; other entry points run without it
+        return _json({"success": False, "error": "Background exploration is not running"}), 503
+    
     try:
-        result = explorer.autonomous_universe_exploration()
-        return jsonify({"success": True, "result": result})
+        if exploration_wake is not None:
+            # Repeated wakes collapse into one pending pass on the periodic loop
+            exploration_loop.call_soon_threadsafe(exploration_wake.set)
+        else:
+            with pending_exploration_lock:
+                if pending_exploration is not None and not pending_exploration.done():
+                    return _exploration_busy()
+                pending_exploration = asyncio.run_coroutine_threadsafe(
+                    explorer.autonomous_universe_exploration_async(), exploration_loop)
+        return _json({"success": True, "queued": True}), 202
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)})
+        return _json({"success": False, "error": str(e)}), 503
 
 if __name__ == '__main__':
+    # Local development server; production runs `gunicorn -c gunicorn_conf.py wsgi:application`
+    start_background_exploration()
     app.run(host='0.0.0.0', port=8080, debug=False)
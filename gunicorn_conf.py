@@ -0,0 +1,30 @@
+# AI Universe Explorer - gunicorn configuration
+# Run with: gunicorn -c gunicorn_conf.py wsgi:application
+import fcntl
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+worker_class = 'gthread'
+threads = 8
+preload_app = True  # Bootstrap the universe once in the master, then fork
+
+EXPLORER_LOCK_PATH = '/tmp/universe-explorer.lock'
+_explorer_lock = None
+
+def post_fork(server, worker):
+    """Start background exploration; only the worker holding the lock explores"""
+    global _explorer_lock
+    from app import start_background_exploration
+    
+    lock_file = open(EXPLORER_LOCK_PATH, 'w')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        _explorer_lock = lock_file
+        leader = True
+    except OSError:
+        lock_file.close()
+        leader = False
+    
+    server.log.info("Worker %s exploration role: %s", worker.pid, 'leader' if leader else 'follower')
+    start_background_exploration(leader)
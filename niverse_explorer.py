@@ -1,10 +1,78 @@
 # AI Universe Explorer - Core Engine
-import requests
-import json
+import logging
+import threading
+import numpy as np
+import orjson
 import time
 import random
-from datetime import datetime
 from collections import defaultdict, deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+
+DISCOVERY_CONCURRENCY = 3  # Upstream requests in flight per discovery pass
+MAX_STORED_INSIGHTS = 500
+MAX_EXPLORATION_HISTORY = 500
+MAX_RETRY_DELAY = 5.0  # Cap on any single Retry-After wait
+
+logger = logging.getLogger('universe.engine')
+
+def _now_iso():
+    """Local time as an ISO-8601 string to the second, without building a datetime"""
+    return time.strftime('%Y-%m-%dT%H:%M:%S')
+
+_session = None
+_session_lock = threading.Lock()  # Parallel bootstrap discoveries must share one session
+
+def get_session():
+    """Shared HTTP session, built on first use so importing the engine stays cheap.
+
+    Keep-alive connection pooling plus backoff retries
+    (Retry honours the Retry-After header on 429 responses, capped at MAX_RETRY_DELAY).
+    """
+    global _session
+    if _session is not None:
+        return _session
+    
+    with _session_lock:
+        if _session is not None:
+            return _session
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        class CappedRetry(Retry):
+            """Retry that never sleeps longer than MAX_RETRY_DELAY for a Retry-After header"""
+            
+            def get_retry_after(self, response):
+                retry_after = super().get_retry_after(response)
+                return None if retry_after is None else min(retry_after, MAX_RETRY_DELAY)
+        
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': 'universe-explorer/1.0',
+            'Accept-Encoding': 'gzip, deflate'  # CoinGecko market pages compress ~10x
+        })
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=CappedRetry(total=2, backoff_factor=0.5, status_forcelist=(429, 502, 503))
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)  # arXiv API
+        _session = session
+        return _session
+
+def fetch_all(fetch, items):
+    """Run fetch over items on a small thread pool, in order; failures come back as exceptions"""
+    def guarded(item):
+        try:
+            return fetch(item)
+        except Exception as e:
+            return e
+    
+    with ThreadPoolExecutor(max_workers=DISCOVERY_CONCURRENCY) as pool:
+        return list(pool.map(guarded, items))
 
 class UniverseDataExplorer:
     """
@@ -14,10 +82,14 @@ class UniverseDataExplorer:
     def __init__(self):
         # Discovery systems
         self.data_universe = defaultdict(dict)
-        self.autonomous_insights = []
-        self.exploration_history = []
+        self.autonomous_insights = deque(maxlen=MAX_STORED_INSIGHTS)
+        self.exploration_history = deque(maxlen=MAX_EXPLORATION_HISTORY)
         self.pattern_memory = defaultdict(float)
         self.world_pattern_memory = defaultdict(float)
+        self._total_entities = 0
+        self._universe_lock = threading.Lock()
+        self._financial_symbols = []
+        self._financial_changes = np.empty(0)
         
         # Exploration state
         self.exploration_state = {
@@ -26,70 +98,91 @@ class UniverseDataExplorer:
             'last_update': time.time()
         }
         
-        print("🌌 Universe Data Explorer initialized")
+        logger.info("🌌 Universe Data Explorer initialized")
         self._bootstrap_universe()
     
     def _bootstrap_universe(self):
         """Bootstrap initial universe discovery"""
-        print("🚀 Bootstrapping universe discovery...")
+        logger.info("🚀 Bootstrapping universe discovery...")
         
-        # Auto-discover crypto universe
-        self._discover_crypto_universe()
+        # Crypto, news and research discovery are independent network I/O; run them side by side.
+        # Domain slots are reserved up front so the universe keeps a stable order.
+        discoveries = (
+            ('financial', self._discover_crypto_universe),
+            ('news', self._discover_news_universe),
+            ('research', self._discover_research_universe),
+        )
+        for domain, _ in discoveries:
+            self.data_universe[domain] = {}
         
-        # Auto-discover news sources
-        self._discover_news_universe()
+        with ThreadPoolExecutor(max_workers=len(discoveries)) as pool:
+            for _, discover in discoveries:
+                pool.submit(discover)
         
-        # Auto-discover research domains
-        self._discover_research_universe()
-        
-        print(f"✅ Bootstrap complete: {self.get_total_entities()} entities discovered")
+        logger.info("✅ Bootstrap complete: %d entities discovered", self.get_total_entities())
+    
+    def _set_domain(self, domain, data):
+        """Replace a domain's entities and refresh the cached entity total"""
+        with self._universe_lock:
+            self.data_universe[domain] = data
+            self._total_entities = sum(len(domain_data) for domain_data in self.data_universe.values())
+            if domain == 'financial':
+                # Columnar copy of the fields insight scans read (missing changes become NaN)
+                self._financial_symbols = list(data)
+                self._financial_changes = np.array(
+                    [details.get('price_change_24h') for details in data.values()], dtype=np.float64)
     
     def _discover_crypto_universe(self):
         """Discover cryptocurrency universe"""
         try:
-            print("🪙 Discovering crypto universe...")
+            logger.info("🪙 Discovering crypto universe...")
             
             url = "https://api.coingecko.com/api/v3/coins/markets"
             crypto_data = {}
+            now_iso = _now_iso()
+            session = get_session()
+            pages = range(1, 4)  # Top 750 crypto
             
-            for page in range(1, 4):  # Top 750 crypto
-                try:
-                    params = {
-                        'vs_currency': 'usd',
-                        'order': 'market_cap_desc',
-                        'per_page': 250,
-                        'page': page
-                    }
-                    
-                    response = requests.get(url, params=params, timeout=10)
-                    if response.status_code == 200:
-                        cryptos = response.json()
-                        for crypto in cryptos:
-                            symbol = crypto['symbol'].upper()
-                            crypto_data[f"{symbol}-USD"] = {
-                                'name': crypto['name'],
-                                'current_price': crypto.get('current_price'),
-                                'market_cap': crypto.get('market_cap'),
-                                'price_change_24h': crypto.get('price_change_percentage_24h', 0),
-                                'discovered_at': datetime.now().isoformat(),
-                                'type': 'cryptocurrency'
-                            }
-                except Exception as e:
-                    print(f"Crypto page {page} error: {e}")
+            def fetch_page(page):
+                params = {
+                    'vs_currency': 'usd',
+                    'order': 'market_cap_desc',
+                    'per_page': 250,
+                    'page': page
+                }
+                response = session.get(url, params=params, timeout=10)
+                if response.status_code != 200:
+                    return []
+                # Project the ~40 CoinGecko fields down to the five we keep
+                return [(crypto['symbol'], crypto['name'], crypto.get('current_price'),
+                         crypto.get('market_cap'), crypto.get('price_change_percentage_24h', 0))
+                        for crypto in orjson.loads(response.content)]
+            
+            for page, cryptos in zip(pages, fetch_all(fetch_page, pages)):
+                if isinstance(cryptos, Exception):
+                    logger.warning("Crypto page %s error: %s", page, cryptos)
                     continue
                 
-                time.sleep(1)  # Rate limiting
+                for symbol, name, price, market_cap, change in cryptos:
+                    crypto_data[f"{symbol.upper()}-USD"] = {
+                        'name': name,
+                        'current_price': price,
+                        'market_cap': market_cap,
+                        'price_change_24h': change,
+                        'discovered_at': now_iso,
+                        'type': 'cryptocurrency'
+                    }
             
-            self.data_universe['financial'] = crypto_data
-            print(f"🪙 Discovered {len(crypto_data)} cryptocurrencies")
+            self._set_domain('financial', crypto_data)
+            logger.info("🪙 Discovered %d cryptocurrencies", len(crypto_data))
             
         except Exception as e:
-            print(f"Crypto discovery error: {e}")
+            logger.error("Crypto discovery error: %s", e)
     
     def _discover_news_universe(self):
         """Discover news sources universe"""
         try:
-            print("📰 Discovering news universe...")
+            logger.info("📰 Discovering news universe...")
             
             news_sources = [
                 'https://feeds.feedburner.com/TechCrunch',
@@ -98,35 +191,42 @@ class UniverseDataExplorer:
             ]
             
             news_data = {}
+            now_iso = _now_iso()
             
-            for source_url in news_sources:
-                try:
-                    import feedparser
-                    feed = feedparser.parse(source_url)
-                    
-                    if feed.entries:
-                        source_name = feed.feed.get('title', source_url)
-                        news_data[source_name] = {
-                            'url': source_url,
-                            'articles_count': len(feed.entries),
-                            'latest_article': feed.entries[0].get('title', '') if feed.entries else '',
-                            'discovered_at': datetime.now().isoformat(),
-                            'type': 'news_source'
-                        }
-                except Exception as e:
-                    print(f"News source error: {e}")
+            import feedparser
+            session = get_session()
+            
+            def fetch_feed(source_url):
+                # Fetch through the pooled session; feedparser only parses the bytes
+                response = session.get(source_url, timeout=10)
+                response.raise_for_status()
+                return feedparser.parse(response.content)
+            
+            for source_url, feed in zip(news_sources, fetch_all(fetch_feed, news_sources)):
+                if isinstance(feed, Exception):
+                    logger.warning("News source error: %s", feed)
                     continue
+                
+                if feed.entries:
+                    source_name = feed.feed.get('title', source_url)
+                    news_data[source_name] = {
+                        'url': source_url,
+                        'articles_count': len(feed.entries),
+                        'latest_article': feed.entries[0].get('title', '') if feed.entries else '',
+                        'discovered_at': now_iso,
+                        'type': 'news_source'
+                    }
             
-            self.data_universe['news'] = news_data
-            print(f"📰 Discovered {len(news_data)} news sources")
+            self._set_domain('news', news_data)
+            logger.info("📰 Discovered %d news sources", len(news_data))
             
         except Exception as e:
-            print(f"News discovery error: {e}")
+            logger.error("News discovery error: %s", e)
     
     def _discover_research_universe(self):
         """Discover research universe"""
         try:
-            print("🧬 Discovering research universe...")
+            logger.info("🧬 Discovering research universe...")
             
             research_categories = [
                 'cs.AI', 'cs.LG', 'cs.CL', 'cs.CV', 'cs.RO',
@@ -134,41 +234,44 @@ class UniverseDataExplorer:
             ]
             
             research_data = {}
+            now_iso = _now_iso()
             
-            for category in research_categories:
-                try:
-                    url = f"http://export.arxiv.org/api/query?search_query=cat:{category}&start=0&max_results=10&sortBy=submittedDate&sortOrder=descending"
-                    
-                    response = requests.get(url, timeout=10)
-                    if response.status_code == 200:
-                        paper_count = response.text.count('<entry>')
-                        research_data[category] = {
-                            'recent_papers': paper_count,
-                            'category': category,
-                            'discovered_at': datetime.now().isoformat(),
-                            'type': 'research_category'
-                        }
-                except Exception as e:
-                    print(f"Research category {category} error: {e}")
+            session = get_session()
+            
+            def fetch_category(category):
+                url = f"http://export.arxiv.org/api/query?search_query=cat:{category}&start=0&max_results=10&sortBy=submittedDate&sortOrder=descending"
+                return session.get(url, timeout=10)
+            
+            # Capped at DISCOVERY_CONCURRENCY in flight instead of sleeping between requests
+            for category, response in zip(research_categories, fetch_all(fetch_category, research_categories)):
+                if isinstance(response, Exception):
+                    logger.warning("Research category %s error: %s", category, response)
                     continue
                 
-                time.sleep(1)  # Rate limiting
+                if response.status_code == 200:
+                    paper_count = response.content.count(b'<entry>')  # Count on raw bytes, no decode
+                    research_data[category] = {
+                        'recent_papers': paper_count,
+                        'category': category,
+                        'discovered_at': now_iso,
+                        'type': 'research_category'
+                    }
             
-            self.data_universe['research'] = research_data
-            print(f"🧬 Discovered {len(research_data)} research domains")
+            self._set_domain('research', research_data)
+            logger.info("🧬 Discovered %d research domains", len(research_data))
             
         except Exception as e:
-            print(f"Research discovery error: {e}")
+            logger.error("Research discovery error: %s", e)
     
     def autonomous_universe_exploration(self):
         """Perform autonomous exploration"""
-        print("🔍 Starting autonomous exploration...")
+        logger.info("🔍 Starting autonomous exploration...")
         
         exploration_results = {
             'new_discoveries': 0,
             'patterns_found': 0,
             'insights_generated': 0,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
         
         # Generate insights from current data
@@ -184,24 +287,27 @@ class UniverseDataExplorer:
     
     def _generate_autonomous_insights(self):
         """Generate insights autonomously"""
+        ts = _now_iso()
         try:
             # Financial insights
-            financial_data = self.data_universe.get('financial', {})
-            if financial_data:
+            changes = self._financial_changes
+            if len(changes):
                 # Find big price movers
-                big_movers = []
-                for symbol, data in financial_data.items():
-                    if isinstance(data, dict):
-                        change = data.get('price_change_24h', 0)
-                        if abs(change) > 10:  # >10% change
-                            big_movers.append((symbol, change))
+                abs_changes = np.abs(changes)
+                movers = np.flatnonzero(abs_changes > 10)  # >10% change
                 
-                if big_movers:
+                if len(movers):
+                    # Top 5 by move size: partition, then order only those five
+                    top = movers
+                    if len(top) > 5:
+                        top = top[np.argpartition(-abs_changes[top], 5)[:5]]
+                    top = top[np.argsort(-abs_changes[top], kind='stable')]
+                    
                     self.autonomous_insights.append({
                         'type': 'market_movement',
-                        'description': f"Detected {len(big_movers)} cryptocurrencies with >10% price movement",
-                        'details': big_movers[:5],  # Top 5
-                        'timestamp': datetime.now().isoformat()
+                        'description': f"Detected {len(movers)} cryptocurrencies with >10% price movement",
+                        'details': [(self._financial_symbols[i], float(changes[i])) for i in top],
+                        'timestamp': ts
                     })
             
             # Cross-domain insights
@@ -211,11 +317,11 @@ class UniverseDataExplorer:
                     'type': 'cross_domain_analysis',
                     'description': f"Universe spans {len(domains)} domains: {', '.join(domains)}",
                     'entity_count': self.get_total_entities(),
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': ts
                 })
         
         except Exception as e:
-            print(f"Insight generation error: {e}")
+            logger.error("Insight generation error: %s", e)
     
     def _universal_search(self, search_term):
         """Search across entire universe"""
@@ -223,7 +329,7 @@ class UniverseDataExplorer:
             'search_term': search_term,
             'results_by_domain': {},
             'total_matches': 0,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
         
         search_lower = search_term.lower()
@@ -271,14 +377,15 @@ class UniverseDataExplorer:
             'total_discoveries': self.get_total_entities(),
             'autonomous_insights': len(self.autonomous_insights),
             'exploration_state': self.exploration_state,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
     
     def get_recent_insights(self, limit=10):
         """Get recent insights"""
         recent_insights = []
         
-        for insight in self.autonomous_insights[-limit:]:
+        start = max(0, len(self.autonomous_insights) - limit)
+        for insight in islice(self.autonomous_insights, start, None):
             recent_insights.append({
                 'category': insight.get('type', 'general'),
                 'description': insight.get('description', ''),
@@ -290,9 +397,10 @@ class UniverseDataExplorer:
     
     def get_total_entities(self):
         """Get total entities discovered"""
-        return sum(len(domain_data) for domain_data in self.data_universe.values())
+        return self._total_entities
 
 # Initialize explorer when module is imported
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     explorer = UniverseDataExplorer()
-    print(f"🌌 Universe initialized with {explorer.get_total_entities()} entities")
+    logger.info("🌌 Universe initialized with %d entities", explorer.get_total_entities())
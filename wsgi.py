@@ -0,0 +1,7 @@
+# AI Universe Explorer - WSGI entry point
+# Serve with `gunicorn -c gunicorn_conf.py wsgi:application`: the config's post_fork
+# hook starts background exploration. Without it (plain `gunicorn wsgi:application`,
+# `flask run`) the API still serves, but nothing explores and /explore answers 503.
+from app import app
+
+application = app